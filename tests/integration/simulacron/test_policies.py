@@ -26,7 +26,8 @@ from tests.integration import greaterthancass21, requiressimulacron, SIMULACRON_
     CASSANDRA_VERSION
 from tests.integration.simulacron import PROTOCOL_VERSION
 from tests.integration.simulacron.utils import start_and_prime_singledc, prime_query, \
-    stop_simulacron, NO_THEN, clear_queries
+    stop_simulacron, NO_THEN, clear_queries, prime_queries_bulk, PrimeQuery, \
+    default_rows, default_column_types
 
 from itertools import count
 from packaging.version import Version
@@ -37,13 +38,25 @@ class BadRoundRobinPolicy(RoundRobinPolicy):
         pos = self._position
         self._position += 1
 
-        hosts = []
-        for _ in range(10):
-            hosts.extend(self._live_hosts)
+        hosts = list(self._live_hosts) * 10
 
         return hosts
 
 
+def setup_module():
+    if SIMULACRON_JAR is None or CASSANDRA_VERSION < Version("2.1"):
+        return
+
+    start_and_prime_singledc()
+
+
+def teardown_module():
+    if SIMULACRON_JAR is None or CASSANDRA_VERSION < Version("2.1"):
+        return
+
+    stop_simulacron()
+
+
 # This doesn't work well with Windows clock granularity
 @requiressimulacron
 class SpecExecTest(unittest.TestCase):
@@ -53,7 +66,6 @@ class SpecExecTest(unittest.TestCase):
         if SIMULACRON_JAR is None or CASSANDRA_VERSION < Version("2.1"):
             return
 
-        start_and_prime_singledc()
         cls.cluster = Cluster(protocol_version=PROTOCOL_VERSION, compression=False)
         cls.session = cls.cluster.connect(wait_for_all_pools=True)
 
@@ -79,7 +91,6 @@ class SpecExecTest(unittest.TestCase):
             return
 
         cls.cluster.shutdown()
-        stop_simulacron()
 
     def tearDown(self):
         clear_queries()
@@ -97,7 +108,14 @@ class SpecExecTest(unittest.TestCase):
         @test_category metadata
         """
         query_to_prime = "INSERT INTO test3rf.test (k, v) VALUES (0, 1);"
-        prime_query(query_to_prime, then={"delay_in_ms": 10000})
+        prepared_query_to_prime = "SELECT * FROM test3rf.test where k = ?"
+        when = {"params": {"k": "0"}, "param_types": {"k": "ascii"}}
+        prime_queries_bulk([
+            PrimeQuery(query_to_prime, rows=default_rows, column_types=default_column_types,
+                       then={"delay_in_ms": 10000}),
+            PrimeQuery(prepared_query_to_prime, rows=default_rows, column_types=default_column_types,
+                       when=when, then={"delay_in_ms": 4000})
+        ])
 
         statement = SimpleStatement(query_to_prime, is_idempotent=True)
         statement_non_idem = SimpleStatement(query_to_prime, is_idempotent=False)
@@ -130,10 +148,6 @@ class SpecExecTest(unittest.TestCase):
         with self.assertRaises(OperationTimedOut):
             self.session.execute(statement, execution_profile='spec_ep_rr', timeout=.5)
 
-        prepared_query_to_prime = "SELECT * FROM test3rf.test where k = ?"
-        when = {"params": {"k": "0"}, "param_types": {"k": "ascii"}}
-        prime_query(prepared_query_to_prime, when=when, then={"delay_in_ms": 4000})
-
         # PYTHON-736 Test speculation policy works with a prepared statement
         prepared_statement = self.session.prepare(prepared_query_to_prime)
         # non-idempotent
@@ -159,13 +173,12 @@ class SpecExecTest(unittest.TestCase):
 
         statement = SimpleStatement(query_to_prime, is_idempotent=True)
 
-        # An OperationTimedOut is placed here in response_future,
-        # that's why we can't call session.execute,which would raise it, but
-        # we have to directly wait for the event
+        # Event.wait returns as soon as the OperationTimedOut is set in response_future,
+        # the 16 seconds are only an upper bound in case the request timeout is not honored
         response_future = self.session.execute_async(statement, execution_profile='spec_ep_brr_lim',
                                                      timeout=14)
-        response_future._event.wait(16)
-        self.assertIsInstance(response_future._final_exception, OperationTimedOut)
+        self.assertTrue(response_future._event.wait(16))
+        self.assertRaises(OperationTimedOut, response_future.result)
 
         # This is because 14 / 4 + 1 = 4
         self.assertEqual(len(response_future.attempted_hosts), 4)
@@ -254,17 +267,6 @@ class CounterRetryPolicy(RetryPolicy):
 
 @requiressimulacron
 class RetryPolicyTests(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        if SIMULACRON_JAR is None or CASSANDRA_VERSION < Version("2.1"):
-            return
-        start_and_prime_singledc()
-
-    @classmethod
-    def tearDownClass(cls):
-        if SIMULACRON_JAR is None or CASSANDRA_VERSION < Version("2.1"):
-            return
-        stop_simulacron()
 
     def tearDown(self):
         clear_queries()
@@ -305,9 +307,11 @@ class RetryPolicyTests(unittest.TestCase):
             "write_type": "SIMPLE",
             "ignore_on_prepare": True
           }
-        prime_query(query_to_prime_simple, rows=None, column_types=None, then=then)
-        then["write_type"] = "CDC"
-        prime_query(query_to_prime_cdc, rows=None, column_types=None, then=then)
+        then_cdc = dict(then, write_type="CDC")
+        prime_queries_bulk([
+            PrimeQuery(query_to_prime_simple, rows=None, column_types=None, then=then),
+            PrimeQuery(query_to_prime_cdc, rows=None, column_types=None, then=then_cdc)
+        ])
 
         with self.assertRaises(WriteTimeout):
             self.session.execute(query_to_prime_simple)
@@ -15,6 +15,7 @@
 import json
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from six.moves.urllib.request import build_opener, Request, HTTPHandler
 
 from cassandra.metadata import SchemaParserV4, SchemaParserDSE68
@@ -459,6 +460,19 @@ def prime_query(query, rows=default_rows, column_types=default_column_types, whe
     return response
 
 
+def prime_queries_bulk(queries):
+    """
+    Primes several queries concurrently, simulacron only accepts one prime per request
+    :param queries: list of PrimeQuery or PrimeOptions
+    :return: the responses, in the same order as the queries
+    """
+    if not queries:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        return list(executor.map(prime_request, queries))
+
+
 def clear_queries():
     """
     Clears all the queries that have been primed to simulacron